@@ -1,12 +1,16 @@
+from datetime import datetime
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.schemas import DocumentResponse, DocumentListResponse
 from app.services.document_service import DocumentService
 from app.services.file_service import FileService
+from app.services.export_service import ExportService
 from app.config import DEFAULT_PAGE, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.profiling import profile_phase, mark_phase
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
@@ -19,12 +23,17 @@ async def upload_document(
     Upload a document.
     Accepts PDF, TXT, and DOCX files up to 10MB.
     """
+    # Multipart parsing and dependency resolution happen before the endpoint is called
+    mark_phase("request_parsing")
+
     try:
         # Validate file
-        file_extension, file_size = FileService.validate_file(file)
+        with profile_phase("validation"):
+            file_extension, file_size = FileService.validate_file(file)
 
         # Save file
-        relative_path = FileService.save_file(file, file_extension)
+        with profile_phase("file_io"):
+            relative_path = FileService.save_file(file, file_extension)
 
         # Create document record
         from app.schemas import DocumentCreate
@@ -35,9 +44,11 @@ async def upload_document(
             type=file_extension,
         )
 
-        db_document = DocumentService.create_document(db, document_data, relative_path)
+        with profile_phase("database"):
+            db_document = DocumentService.create_document(db, document_data, relative_path)
 
-        return DocumentResponse.model_validate(db_document)
+        with profile_phase("serialization"):
+            return DocumentResponse.model_validate(db_document)
 
     except HTTPException:
         raise
@@ -54,16 +65,60 @@ def list_documents(
     """
     List all documents with pagination.
     """
-    documents, total = DocumentService.get_documents(db, page=page, page_size=page_size)
+    mark_phase("request_parsing")
+
+    with profile_phase("database"):
+        documents, total = DocumentService.get_documents(db, page=page, page_size=page_size)
 
     total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
-    return DocumentListResponse(
-        documents=[DocumentResponse.model_validate(doc) for doc in documents],
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
+    with profile_phase("serialization"):
+        return DocumentListResponse(
+            documents=[DocumentResponse.model_validate(doc) for doc in documents],
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+        )
+
+
+@router.get("/export.ndjson")
+def export_documents_ndjson(
+    updated_since: Optional[datetime] = Query(
+        None, description="Only export documents uploaded at or after this time"
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    Stream metadata of all documents as newline-delimited JSON.
+    """
+    mark_phase("request_parsing")
+
+    batches = DocumentService.iter_document_batches(db, updated_since=updated_since)
+    return StreamingResponse(
+        ExportService.ndjson_chunks(batches),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="documents.ndjson"'},
+    )
+
+
+@router.get("/export.csv")
+def export_documents_csv(
+    updated_since: Optional[datetime] = Query(
+        None, description="Only export documents uploaded at or after this time"
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    Stream metadata of all documents as CSV.
+    """
+    mark_phase("request_parsing")
+
+    batches = DocumentService.iter_document_batches(db, updated_since=updated_since)
+    return StreamingResponse(
+        ExportService.csv_chunks(batches),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="documents.csv"'},
     )
 
 
@@ -72,11 +127,15 @@ def get_document(document_id: int, db: Session = Depends(get_db)):
     """
     Get document metadata by ID.
     """
-    document = DocumentService.get_document_by_id(db, document_id)
+    mark_phase("request_parsing")
+
+    with profile_phase("database"):
+        document = DocumentService.get_document_by_id(db, document_id)
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    return DocumentResponse.model_validate(document)
+    with profile_phase("serialization"):
+        return DocumentResponse.model_validate(document)
 
 
 @router.get("/{document_id}/download")
@@ -84,13 +143,18 @@ def download_document(document_id: int, db: Session = Depends(get_db)):
     """
     Download document file by ID.
     """
-    document = DocumentService.get_document_by_id(db, document_id)
+    mark_phase("request_parsing")
+
+    with profile_phase("database"):
+        document = DocumentService.get_document_by_id(db, document_id)
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    file_path = FileService.get_file_path(document.file_path)
+    with profile_phase("file_io"):
+        file_path = FileService.get_file_path(document.file_path)
+        file_exists = file_path.exists()
 
-    if not file_path.exists():
+    if not file_exists:
         raise HTTPException(
             status_code=404, detail="Document file not found on disk"
         )
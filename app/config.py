@@ -21,3 +21,16 @@ ALLOWED_MIME_TYPES: Set[str] = {
 DEFAULT_PAGE = 1
 DEFAULT_PAGE_SIZE = 10
 MAX_PAGE_SIZE = 100
+
+# Export configuration
+EXPORT_BATCH_SIZE = 1000  # Rows fetched from the database per batch
+
+# Bulk import defaults
+IMPORT_WORKERS = 8
+IMPORT_BATCH_SIZE = 1000
+
+# Profiling configuration (opt-in, disabled by default)
+PROFILE_DIR = BASE_DIR / "profiles"
+PROFILE_SAMPLE_RATE = 0.0  # Fraction of requests to profile (0.0 - 1.0)
+PROFILE_HEADER_ENABLED = False  # Honor PROFILE_HEADER on incoming requests
+PROFILE_HEADER = "X-Profile"
@@ -6,7 +6,8 @@ from app.config import DATABASE_URL
 
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": True},
+    # Sync endpoints and streamed responses use the session from threadpool workers
+    connect_args={"check_same_thread": False},
     poolclass=QueuePool
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -0,0 +1,81 @@
+"""
+Bulk-import an existing directory tree of documents.
+
+Usage:
+    python -m app.import_documents /path/to/archive [--workers 8] [--batch-size 1000] [--link]
+"""
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from app.database import SessionLocal, init_db
+from app.services.import_service import ImportService, ImportStats
+from app.config import IMPORT_WORKERS, IMPORT_BATCH_SIZE
+
+
+def format_progress(stats: ImportStats) -> str:
+    """Format import statistics as a single progress line."""
+    return (
+        f"{stats.scanned} scanned, {stats.imported} imported, "
+        f"{stats.skipped_existing} already imported, {stats.skipped_invalid} invalid, "
+        f"{stats.failed} failed | "
+        f"{stats.files_per_second:.1f} files/s, {stats.mb_per_second:.2f} MB/s, "
+        f"{stats.elapsed:.1f}s elapsed"
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Bulk-import an existing directory of documents."
+    )
+    parser.add_argument("source", type=Path, help="Directory to import")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=IMPORT_WORKERS,
+        help=f"Number of parallel file workers (default: {IMPORT_WORKERS})",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=IMPORT_BATCH_SIZE,
+        help=f"Documents per database transaction (default: {IMPORT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--link",
+        action="store_true",
+        help="Hard-link files instead of copying them (copies across filesystems)",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.source.is_dir():
+        parser.error(f"{args.source} is not a directory")
+    if args.workers < 1 or args.batch_size < 1:
+        parser.error("--workers and --batch-size must be at least 1")
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+
+    init_db()
+    db = SessionLocal()
+    try:
+        stats = ImportService.import_directory(
+            db,
+            args.source,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            link=args.link,
+            on_progress=lambda stats: print(format_progress(stats), flush=True),
+        )
+    except KeyboardInterrupt:
+        print("Interrupted; re-run the same command to resume.", file=sys.stderr)
+        return 130
+    finally:
+        db.close()
+
+    print(f"Done: {format_progress(stats)}")
+    return 1 if stats.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
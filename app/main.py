@@ -7,6 +7,7 @@ import logging
 from app.database import init_db
 from app.api.routes import documents
 from app.config import UPLOAD_DIR
+from app.profiling import ProfilingMiddleware
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,9 @@ app = FastAPI(
     version="1.0.0",
 )
 
+# Opt-in request profiling, see PROFILE_* in app/config.py
+app.add_middleware(ProfilingMiddleware)
+
 # Include routers
 app.include_router(documents.router)
 
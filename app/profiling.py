@@ -0,0 +1,247 @@
+import cProfile
+import json
+import logging
+import pstats
+import random
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import anyio
+
+from app.config import (
+    PROFILE_DIR,
+    PROFILE_SAMPLE_RATE,
+    PROFILE_HEADER_ENABLED,
+    PROFILE_HEADER,
+)
+
+logger = logging.getLogger(__name__)
+
+_current_profile: ContextVar[Optional["RequestProfile"]] = ContextVar(
+    "current_profile", default=None
+)
+
+# cProfile hooks are per thread and the event loop thread is shared by every
+# in-flight request, so only one request is profiled at a time. Coroutine steps
+# of unprofiled requests that run on the loop while a profile is active still
+# appear in its call-stack profile; the phase timings are not affected.
+_profiling_lock = threading.Lock()
+
+# Up to Python 3.11 cProfile only sees the thread that enabled it, so worker
+# threads need their own profiler. From 3.12 it is process-wide (sys.monitoring)
+# and a second profiler cannot be started while the middleware's is active.
+PER_THREAD_PROFILERS = sys.version_info < (3, 12)
+
+
+class RequestProfile:
+    """Call-stack profile and phase timings collected for a single request."""
+
+    def __init__(self, method: str, path: str):
+        self.id = uuid.uuid4().hex
+        self.method = method
+        self.path = path
+        self.started_at = datetime.now(timezone.utc)
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.status_code: Optional[int] = None
+        self.phases: Dict[str, float] = {}
+        self._last_mark = self.start
+        self._lock = threading.Lock()
+        self._profilers: List[cProfile.Profile] = []
+        self._active_threads = set()
+
+    def record(self, name: str, seconds: float, now: float):
+        """Add elapsed seconds to a phase."""
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+            self._last_mark = max(self._last_mark, now)
+
+    def mark(self, name: str):
+        """Attribute the time since the previous mark to a phase."""
+        now = time.perf_counter()
+        self.record(name, now - self._last_mark, now)
+
+    def enable_for_current_thread(self) -> Optional[cProfile.Profile]:
+        """
+        Start a profiler for the calling thread.
+        Returns: the new profiler, or None if this thread is already profiled
+        or the profiler could not be started
+        """
+        thread_id = threading.get_ident()
+        with self._lock:
+            if thread_id in self._active_threads:
+                return None
+            self._active_threads.add(thread_id)
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except Exception as e:
+            logger.warning(f"Could not start profiler: {str(e)}")
+            with self._lock:
+                self._active_threads.discard(thread_id)
+            return None
+
+        with self._lock:
+            self._profilers.append(profiler)
+        return profiler
+
+    def disable_for_current_thread(self, profiler: cProfile.Profile):
+        """Stop a profiler started by enable_for_current_thread."""
+        profiler.disable()
+        with self._lock:
+            self._active_threads.discard(threading.get_ident())
+
+    def report(self) -> dict:
+        """Build the phase breakdown for this request."""
+        end = self.end if self.end is not None else time.perf_counter()
+        total = end - self.start
+        phases_ms = {name: round(seconds * 1000, 3) for name, seconds in self.phases.items()}
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "status_code": self.status_code,
+            "started_at": self.started_at.isoformat(),
+            "total_ms": round(total * 1000, 3),
+            "phases_ms": phases_ms,
+            "unaccounted_ms": round((total - sum(self.phases.values())) * 1000, 3),
+        }
+
+    def write(self) -> str:
+        """
+        Write the profile to PROFILE_DIR.
+        The call-stack profile is saved as <name>.prof (pstats format, readable
+        by pstats, snakeviz, gprof2dot) and the phase breakdown as <name>.json.
+        Returns: base path of the written files (without extension)
+        """
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        slug = self.path.strip("/").replace("/", "_") or "root"
+        timestamp = self.started_at.strftime("%Y%m%dT%H%M%S")
+        base_path = PROFILE_DIR / f"{timestamp}-{self.method}-{slug}-{self.id[:8]}"
+
+        if self._profilers:
+            stats = pstats.Stats(self._profilers[0])
+            for profiler in self._profilers[1:]:
+                stats.add(profiler)
+            stats.dump_stats(f"{base_path}.prof")
+
+        with open(f"{base_path}.json", "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+        return str(base_path)
+
+
+def get_current_profile() -> Optional[RequestProfile]:
+    """Get the profile of the current request, if it is being profiled."""
+    return _current_profile.get()
+
+
+@contextmanager
+def profile_phase(name: str):
+    """
+    Time a block of code as a named phase of the current request.
+    No-op when the request is not being profiled.
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        yield
+        return
+
+    # Sync endpoints run in a worker thread, which the middleware's
+    # profiler does not see before Python 3.12.
+    profiler = profile.enable_for_current_thread() if PER_THREAD_PROFILERS else None
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        now = time.perf_counter()
+        profile.record(name, now - start, now)
+        if profiler is not None:
+            profile.disable_for_current_thread(profiler)
+
+
+def mark_phase(name: str):
+    """Attribute the time since the previous phase (or request start) to a phase."""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.mark(name)
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that profiles sampled requests.
+    A request is profiled when PROFILE_HEADER_ENABLED is set and the request
+    carries a truthy PROFILE_HEADER, or when it falls within PROFILE_SAMPLE_RATE.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    def _should_profile(self, scope) -> bool:
+        if PROFILE_HEADER_ENABLED:
+            header_name = PROFILE_HEADER.lower().encode("latin-1")
+            for name, value in scope["headers"]:
+                if name == header_name and value.lower() in (b"1", b"true", b"yes"):
+                    return True
+        return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or (
+            not PROFILE_HEADER_ENABLED and PROFILE_SAMPLE_RATE <= 0
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if not self._should_profile(scope) or not _profiling_lock.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(scope["method"], scope["path"])
+        body_start = None
+        body_phases_start = 0.0
+
+        async def send_wrapper(message):
+            nonlocal body_start, body_phases_start
+            if message["type"] == "http.response.start":
+                # Response model validation and JSON rendering run after the
+                # endpoint returns, up to the start of the response
+                if profile.phases:
+                    profile.mark("serialization")
+                profile.status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-id", profile.id.encode("latin-1")))
+                message = {**message, "headers": headers}
+                body_start = time.perf_counter()
+                body_phases_start = sum(profile.phases.values())
+
+            await send(message)
+
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                # Sending the body (and reading files for FileResponse), minus
+                # phases recorded by streamed responses in the meantime
+                now = time.perf_counter()
+                streamed = sum(profile.phases.values()) - body_phases_start
+                profile.record("response_body", now - body_start - streamed, now)
+
+        token = _current_profile.set(profile)
+        profiler = profile.enable_for_current_thread()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if profiler is not None:
+                profile.disable_for_current_thread(profiler)
+            profile.end = time.perf_counter()
+            _current_profile.reset(token)
+            try:
+                await anyio.to_thread.run_sync(profile.write)
+            except Exception as e:
+                logger.error(f"Error writing request profile: {str(e)}", exc_info=True)
+            finally:
+                _profiling_lock.release()
@@ -1,11 +1,14 @@
-from typing import List, Optional, Tuple
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
+from sqlalchemy.engine import Row
 from fastapi import HTTPException
 
 from app.models import Document
 from app.schemas import DocumentCreate, DocumentResponse
-from app.config import DEFAULT_PAGE, DEFAULT_PAGE_SIZE
+from app.config import DEFAULT_PAGE, DEFAULT_PAGE_SIZE, EXPORT_BATCH_SIZE
+from app.profiling import profile_phase
 
 
 class DocumentService:
@@ -52,6 +55,50 @@ class DocumentService:
 
         return documents, total
 
+    @staticmethod
+    def iter_document_batches(
+        db: Session,
+        updated_since: Optional[datetime] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> Iterator[List[Row]]:
+        """
+        Stream all document rows in batches, ordered by ID.
+        Each batch is a short keyset query (id > last seen id) in its own
+        transaction, so memory use is bounded by batch_size and no read lock
+        is held between batches to block concurrent uploads.
+        Yields: lists of rows with the DocumentResponse fields
+        """
+        query = select(
+            Document.id,
+            Document.filename,
+            Document.size,
+            Document.type,
+            Document.upload_timestamp,
+            Document.file_path,
+        ).order_by(Document.id).limit(batch_size)
+
+        if updated_since is not None:
+            # Timestamps are stored in UTC without an offset, and server
+            # defaults have no fractional seconds; compare at second precision
+            if updated_since.tzinfo is not None:
+                updated_since = updated_since.astimezone(timezone.utc).replace(tzinfo=None)
+            query = query.where(
+                func.datetime(Document.upload_timestamp)
+                >= func.datetime(updated_since.strftime("%Y-%m-%d %H:%M:%S"))
+            )
+
+        last_id = 0
+        while True:
+            with profile_phase("database"):
+                batch = db.execute(query.where(Document.id > last_id)).all()
+                # End the read transaction before the batch is sent, without
+                # committing anything else pending on the session
+                db.rollback()
+            if not batch:
+                return
+            yield batch
+            last_id = batch[-1].id
+
     @staticmethod
     def delete_document(db: Session, document_id: int) -> bool:
         """Delete document record."""
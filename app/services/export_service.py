@@ -0,0 +1,53 @@
+import csv
+import io
+import json
+from typing import Iterable, Iterator, List
+from sqlalchemy.engine import Row
+
+from app.schemas import DocumentResponse
+from app.profiling import profile_phase
+
+EXPORT_FIELDS = list(DocumentResponse.model_fields)
+
+
+class ExportService:
+    @staticmethod
+    def to_records(batch: List[Row]) -> List[dict]:
+        """Serialize a batch of rows the same way the API serializes documents."""
+        return [
+            DocumentResponse.model_validate(row).model_dump(mode="json")
+            for row in batch
+        ]
+
+    @staticmethod
+    def ndjson_chunks(batches: Iterable[List[Row]]) -> Iterator[str]:
+        """
+        Format batches of rows as NDJSON.
+        Yields: one chunk per batch
+        """
+        for batch in batches:
+            with profile_phase("serialization"):
+                chunk = "".join(
+                    json.dumps(record) + "\n" for record in ExportService.to_records(batch)
+                )
+            yield chunk
+
+    @staticmethod
+    def csv_chunks(batches: Iterable[List[Row]]) -> Iterator[str]:
+        """
+        Format batches of rows as CSV with a header line.
+        Yields: the header, then one chunk per batch
+        """
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+
+        writer.writeheader()
+        yield buffer.getvalue()
+
+        for batch in batches:
+            with profile_phase("serialization"):
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(ExportService.to_records(batch))
+                chunk = buffer.getvalue()
+            yield chunk
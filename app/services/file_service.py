@@ -1,4 +1,5 @@
 import os
+import shutil
 import uuid
 from pathlib import Path
 from typing import Tuple
@@ -30,6 +31,22 @@ class FileService:
         file_size = file.file.tell()
         file.file.seek(0)
 
+        file_extension = FileService.validate_file_info(file.filename or "", file_size)
+
+        # Check MIME type if available
+        if file.content_type and file.content_type not in ALLOWED_MIME_TYPES:
+            # Allow if extension is valid (some clients send wrong MIME types)
+            pass
+
+        return file_extension, file_size
+
+    @staticmethod
+    def validate_file_info(filename: str, file_size: int) -> str:
+        """
+        Validate file name and size.
+        Returns: file_extension
+        Raises: HTTPException if validation fails
+        """
         if file_size > MAX_FILE_SIZE:
             raise HTTPException(
                 status_code=413,
@@ -40,7 +57,6 @@ class FileService:
             raise HTTPException(status_code=400, detail="File is empty")
 
         # Check file extension
-        filename = file.filename or ""
         file_extension = Path(filename).suffix.lower()
 
         if file_extension not in ALLOWED_FILE_TYPES:
@@ -49,12 +65,7 @@ class FileService:
                 detail=f"File type not allowed. Allowed types: {', '.join(ALLOWED_FILE_TYPES)}",
             )
 
-        # Check MIME type if available
-        if file.content_type and file.content_type not in ALLOWED_MIME_TYPES:
-            # Allow if extension is valid (some clients send wrong MIME types)
-            pass
-
-        return file_extension, file_size
+        return file_extension
 
     @staticmethod
     def save_file(file: UploadFile, file_extension: str) -> str:
@@ -76,6 +87,33 @@ class FileService:
 
         return str(file_path.relative_to(UPLOAD_DIR.parent))
 
+    @staticmethod
+    def get_upload_path(file_id: str, file_extension: str) -> str:
+        """Get relative file path for a file stored under the given ID."""
+        file_path = UPLOAD_DIR / f"{file_id}{file_extension}"
+        return str(file_path.relative_to(UPLOAD_DIR.parent))
+
+    @staticmethod
+    def import_file(source_path: Path, relative_path: str, link: bool = False):
+        """
+        Copy or hard-link an existing file into the upload directory.
+        Overwrites any partial file left at the destination by an earlier run.
+        Hard links fall back to a copy when source and destination are on
+        different filesystems.
+        """
+        file_path = FileService.get_file_path(relative_path)
+        if file_path.exists():
+            file_path.unlink()
+
+        if link:
+            try:
+                os.link(source_path, file_path)
+                return
+            except OSError:
+                pass
+
+        shutil.copyfile(source_path, file_path)
+
     @staticmethod
     def get_file_path(relative_path: str) -> Path:
         """Get absolute file path from relative path."""
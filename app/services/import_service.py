@@ -0,0 +1,183 @@
+import logging
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Set, Tuple
+from fastapi import HTTPException
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models import Document
+from app.services.file_service import FileService
+from app.config import IMPORT_WORKERS, IMPORT_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Keeps IN (...) lookups below SQLite's bound parameter limit
+LOOKUP_CHUNK_SIZE = 500
+
+
+class ImportStats:
+    """Running counters for a bulk import."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.scanned = 0
+        self.imported = 0
+        self.skipped_existing = 0
+        self.skipped_invalid = 0
+        self.failed = 0
+        self.bytes_imported = 0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def files_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.imported / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.bytes_imported / (1024 * 1024) / elapsed if elapsed > 0 else 0.0
+
+
+class ImportService:
+    @staticmethod
+    def get_file_id(source_path: Path) -> str:
+        """
+        Get the storage ID for a source file.
+        Derived from the resolved source path, so re-running an import maps
+        each file to the same stored path however the source tree is spelled
+        (relative path, "..", symlinks).
+        """
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, str(source_path.resolve())))
+
+    @staticmethod
+    def scan_directory(source_dir: Path) -> Iterator[Tuple[Path, int]]:
+        """
+        Walk a directory tree in a stable order.
+        Yields: (file_path, file_size)
+        """
+        for root, dirnames, filenames in os.walk(source_dir):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                file_path = Path(root) / filename
+                try:
+                    yield file_path, file_path.stat().st_size
+                except OSError as e:
+                    logger.warning(f"Cannot stat {file_path}: {str(e)}")
+
+    @staticmethod
+    def get_existing_paths(db: Session, relative_paths: List[str]) -> Set[str]:
+        """Get the subset of relative paths that already have a document record."""
+        existing = set()
+        for i in range(0, len(relative_paths), LOOKUP_CHUNK_SIZE):
+            chunk = relative_paths[i:i + LOOKUP_CHUNK_SIZE]
+            rows = db.query(Document.file_path).filter(Document.file_path.in_(chunk))
+            existing.update(row[0] for row in rows)
+        return existing
+
+    @staticmethod
+    def import_batch(
+        db: Session,
+        batch: List[Tuple[Path, int, str]],
+        executor: ThreadPoolExecutor,
+        stats: ImportStats,
+        link: bool = False,
+    ):
+        """
+        Store a batch of validated files and insert their records in one transaction.
+        Each batch item is (source_path, file_size, file_extension).
+        """
+        pending = {}
+        for source_path, file_size, file_extension in batch:
+            file_id = ImportService.get_file_id(source_path)
+            relative_path = FileService.get_upload_path(file_id, file_extension)
+            pending[relative_path] = (source_path, file_size, file_extension)
+
+        existing = ImportService.get_existing_paths(db, list(pending))
+        stats.skipped_existing += len(existing)
+        for relative_path in existing:
+            del pending[relative_path]
+
+        def store(item):
+            relative_path, (source_path, _, _) = item
+            try:
+                FileService.import_file(source_path, relative_path, link=link)
+                return None
+            except OSError as e:
+                return e
+
+        rows = []
+        for (relative_path, (source_path, file_size, file_extension)), error in zip(
+            pending.items(), executor.map(store, pending.items())
+        ):
+            if error is not None:
+                logger.error(f"Error importing {source_path}: {str(error)}")
+                stats.failed += 1
+                continue
+            rows.append(
+                {
+                    "filename": source_path.name,
+                    "size": file_size,
+                    "type": file_extension,
+                    "file_path": relative_path,
+                }
+            )
+
+        if rows:
+            db.execute(insert(Document), rows)
+            db.commit()
+
+        stats.imported += len(rows)
+        stats.bytes_imported += sum(row["size"] for row in rows)
+
+    @staticmethod
+    def import_directory(
+        db: Session,
+        source_dir: Path,
+        workers: int = IMPORT_WORKERS,
+        batch_size: int = IMPORT_BATCH_SIZE,
+        link: bool = False,
+        on_progress: Optional[Callable[[ImportStats], None]] = None,
+    ) -> ImportStats:
+        """
+        Import every valid document under source_dir.
+        Files are validated like uploads, copied (or hard-linked) into the
+        upload directory by a pool of workers and recorded in batches.
+        Files imported by an earlier run are skipped, so an interrupted
+        import can simply be restarted.
+        Returns: import statistics
+        """
+        FileService.ensure_upload_dir()
+        stats = ImportStats()
+        batch: List[Tuple[Path, int, str]] = []
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for source_path, file_size in ImportService.scan_directory(source_dir):
+                stats.scanned += 1
+                try:
+                    file_extension = FileService.validate_file_info(source_path.name, file_size)
+                except HTTPException as e:
+                    logger.info(f"Skipping {source_path}: {e.detail}")
+                    stats.skipped_invalid += 1
+                    continue
+
+                batch.append((source_path, file_size, file_extension))
+                if len(batch) >= batch_size:
+                    ImportService.import_batch(db, batch, executor, stats, link=link)
+                    batch = []
+                    if on_progress:
+                        on_progress(stats)
+
+            if batch:
+                ImportService.import_batch(db, batch, executor, stats, link=link)
+                if on_progress:
+                    on_progress(stats)
+
+        return stats
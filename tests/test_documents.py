@@ -1,6 +1,13 @@
+import csv
+import io
+import json
+from datetime import datetime
+
 import pytest
 from fastapi.testclient import TestClient
 
+from app.models import Document
+
 
 def test_upload_pdf(client: TestClient, sample_pdf_file):
     """Test uploading a PDF file."""
@@ -191,3 +198,100 @@ def test_health_endpoint(client: TestClient):
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
+
+
+def test_export_ndjson(client: TestClient, sample_txt_file):
+    """Test exporting document metadata as NDJSON."""
+    filename, content, content_type = sample_txt_file
+
+    for i in range(3):
+        client.post(
+            "/documents/",
+            files={"file": (f"test{i}.txt", content, content_type)},
+        )
+
+    response = client.get("/documents/export.ndjson")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["filename"] for record in records] == ["test0.txt", "test1.txt", "test2.txt"]
+    assert records[0] == client.get(f"/documents/{records[0]['id']}").json()
+
+
+def test_export_csv(client: TestClient, sample_txt_file):
+    """Test exporting document metadata as CSV."""
+    filename, content, content_type = sample_txt_file
+
+    for i in range(2):
+        client.post(
+            "/documents/",
+            files={"file": (f"test{i}.txt", content, content_type)},
+        )
+
+    response = client.get("/documents/export.csv")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 2
+    assert rows[0]["filename"] == "test0.txt"
+    assert rows[0]["size"] == str(len(content))
+    assert rows[0]["type"] == ".txt"
+
+
+def test_export_empty(client: TestClient):
+    """Test exporting when no documents exist."""
+    response = client.get("/documents/export.ndjson")
+    assert response.status_code == 200
+    assert response.text == ""
+
+    response = client.get("/documents/export.csv")
+    assert response.status_code == 200
+    assert response.text.strip() == "filename,size,type,id,upload_timestamp,file_path"
+
+
+def test_export_updated_since(client: TestClient, test_db, sample_txt_file):
+    """Test exporting only documents uploaded after a given time."""
+    filename, content, content_type = sample_txt_file
+
+    for i in range(2):
+        client.post(
+            "/documents/",
+            files={"file": (f"test{i}.txt", content, content_type)},
+        )
+
+    old_document = test_db.query(Document).filter(Document.filename == "test0.txt").one()
+    old_document.upload_timestamp = datetime(2020, 1, 1)
+    test_db.commit()
+
+    response = client.get("/documents/export.ndjson?updated_since=2021-01-01T00:00:00Z")
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert len(lines) == 1
+    assert '"test1.txt"' in lines[0]
+
+
+def test_export_updated_since_includes_boundary(client: TestClient, test_db, sample_txt_file):
+    """Test that updated_since equal to a stored timestamp includes that document."""
+    filename, content, content_type = sample_txt_file
+
+    client.post(
+        "/documents/",
+        files={"file": (filename, content, content_type)},
+    )
+    document = test_db.query(Document).one()
+
+    response = client.get(
+        "/documents/export.ndjson",
+        params={"updated_since": document.upload_timestamp.isoformat()},
+    )
+    assert response.status_code == 200
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["id"] for record in records] == [document.id]
+
+
+def test_export_invalid_updated_since(client: TestClient):
+    """Test exporting with an invalid updated_since value."""
+    response = client.get("/documents/export.csv?updated_since=yesterday")
+    assert response.status_code == 422
@@ -0,0 +1,67 @@
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Document
+from app.services.document_service import DocumentService
+
+
+def add_documents(db, count, start=0):
+    db.execute(
+        insert(Document),
+        [
+            {"filename": f"test{i}.txt", "size": i, "type": ".txt", "file_path": f"uploads/{i}.txt"}
+            for i in range(start, start + count)
+        ],
+    )
+    db.commit()
+
+
+def test_iter_document_batches(test_db):
+    """Test that all documents are returned in ID order, batch_size at a time."""
+    add_documents(test_db, 5)
+
+    batches = list(DocumentService.iter_document_batches(test_db, batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [row.filename for batch in batches for row in batch] == [f"test{i}.txt" for i in range(5)]
+
+
+def test_iter_document_batches_does_not_commit_pending_changes(test_db):
+    """Test that exporting does not commit unrelated changes on the session."""
+    add_documents(test_db, 2)
+    test_db.add(Document(filename="pending.txt", size=1, type=".txt", file_path="uploads/pending.txt"))
+
+    rows = [row for batch in DocumentService.iter_document_batches(test_db) for row in batch]
+
+    assert len(rows) == 2
+    test_db.rollback()
+    assert test_db.query(Document).count() == 2
+
+
+def test_iter_document_batches_does_not_block_writers(tmp_path):
+    """Test that a paused export does not hold a lock that blocks uploads."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'documents.db'}",
+        connect_args={"check_same_thread": False, "timeout": 0.1},
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    export_db = SessionLocal()
+    writer_db = SessionLocal()
+    try:
+        add_documents(writer_db, 5)
+
+        batches = DocumentService.iter_document_batches(export_db, batch_size=2)
+        first_batch = next(batches)
+
+        # Would raise "database is locked" if the export held a read transaction
+        add_documents(writer_db, 1, start=5)
+
+        rows = first_batch + [row for batch in batches for row in batch]
+        assert len(rows) == 6
+    finally:
+        export_db.close()
+        writer_db.close()
+        engine.dispose()
@@ -0,0 +1,90 @@
+import pytest
+from pathlib import Path
+
+from app.models import Document
+from app.services.file_service import FileService
+from app.services.import_service import ImportService
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    """Create a source tree with valid and invalid documents."""
+    source = tmp_path / "archive"
+    (source / "2019" / "reports").mkdir(parents=True)
+    (source / "2020").mkdir()
+
+    (source / "readme.txt").write_bytes(b"top level")
+    (source / "2019" / "reports" / "q1.pdf").write_bytes(b"%PDF-1.4 q1")
+    (source / "2019" / "reports" / "q2.PDF").write_bytes(b"%PDF-1.4 q2")
+    (source / "2020" / "notes.docx").write_bytes(b"docx bytes")
+    (source / "2020" / "photo.jpg").write_bytes(b"not a document")
+    (source / "2020" / "empty.txt").write_bytes(b"")
+
+    return source
+
+
+def test_import_directory(test_db, test_upload_dir, source_dir):
+    """Test importing a directory tree."""
+    stats = ImportService.import_directory(test_db, source_dir, workers=2, batch_size=2)
+
+    assert stats.scanned == 6
+    assert stats.imported == 4
+    assert stats.skipped_invalid == 2
+    assert stats.failed == 0
+
+    documents = test_db.query(Document).all()
+    assert sorted(doc.filename for doc in documents) == ["notes.docx", "q1.pdf", "q2.PDF", "readme.txt"]
+
+    for document in documents:
+        file_path = FileService.get_file_path(document.file_path)
+        assert file_path.parent == test_upload_dir
+        assert file_path.stat().st_size == document.size
+        if document.filename == "q2.PDF":
+            assert document.type == ".pdf"
+
+
+def test_import_directory_resumes(test_db, test_upload_dir, source_dir):
+    """Test that re-running an import skips files already imported."""
+    ImportService.import_directory(test_db, source_dir, workers=2)
+    (source_dir / "2020" / "new.txt").write_bytes(b"added later")
+
+    stats = ImportService.import_directory(test_db, source_dir, workers=2)
+
+    assert stats.imported == 1
+    assert stats.skipped_existing == 4
+    assert test_db.query(Document).count() == 5
+
+
+def test_import_directory_resumes_through_other_path(test_db, test_upload_dir, source_dir, monkeypatch):
+    """Test that resuming through a symlinked or relative path skips imported files."""
+    symlink = source_dir.parent / "mounted-archive"
+    symlink.symlink_to(source_dir, target_is_directory=True)
+    ImportService.import_directory(test_db, symlink)
+
+    monkeypatch.chdir(source_dir / "2020")
+    stats = ImportService.import_directory(test_db, Path("..") / ".." / source_dir.name)
+
+    assert stats.imported == 0
+    assert stats.skipped_existing == 4
+    assert test_db.query(Document).count() == 4
+
+
+def test_import_directory_hard_link(test_db, test_upload_dir, source_dir):
+    """Test importing with hard links instead of copies."""
+    stats = ImportService.import_directory(test_db, source_dir, link=True)
+
+    assert stats.imported == 4
+    document = test_db.query(Document).filter(Document.filename == "readme.txt").one()
+    file_path = FileService.get_file_path(document.file_path)
+    assert file_path.stat().st_ino == (source_dir / "readme.txt").stat().st_ino
+
+
+def test_import_directory_reports_progress(test_db, test_upload_dir, source_dir):
+    """Test that progress is reported after each batch."""
+    progress = []
+
+    ImportService.import_directory(
+        test_db, source_dir, batch_size=3, on_progress=lambda stats: progress.append(stats.imported)
+    )
+
+    assert progress == [3, 4]
@@ -0,0 +1,164 @@
+import cProfile
+import json
+import pstats
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def profile_dir(monkeypatch, tmp_path):
+    """Enable header-triggered profiling into a temporary directory."""
+    import app.profiling as profiling
+    monkeypatch.setattr(profiling, "PROFILE_DIR", tmp_path)
+    monkeypatch.setattr(profiling, "PROFILE_HEADER_ENABLED", True)
+    return tmp_path
+
+
+def test_profiling_disabled_by_default(client: TestClient, tmp_path, monkeypatch):
+    """Test that requests are not profiled unless enabled."""
+    import app.profiling as profiling
+    monkeypatch.setattr(profiling, "PROFILE_DIR", tmp_path)
+
+    response = client.get("/documents/", headers={"X-Profile": "1"})
+
+    assert response.status_code == 200
+    assert "x-profile-id" not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profile_upload_via_header(client: TestClient, profile_dir, sample_txt_file):
+    """Test profiling an upload request through the profile header."""
+    filename, content, content_type = sample_txt_file
+
+    response = client.post(
+        "/documents/",
+        files={"file": (filename, content, content_type)},
+        headers={"X-Profile": "1"},
+    )
+
+    assert response.status_code == 201
+    profile_id = response.headers["x-profile-id"]
+
+    report_files = list(profile_dir.glob("*.json"))
+    assert len(report_files) == 1
+    report = json.loads(report_files[0].read_text())
+    assert report["id"] == profile_id
+    assert report["method"] == "POST"
+    assert report["status_code"] == 201
+    for phase in ("request_parsing", "validation", "file_io", "database", "serialization"):
+        assert report["phases_ms"][phase] > 0
+    assert "response_body" in report["phases_ms"]
+
+    stats = pstats.Stats(str(report_files[0].with_suffix(".prof")))
+    assert stats.total_calls > 0
+
+
+def test_profile_sync_endpoint_captures_worker_thread(client: TestClient, profile_dir):
+    """Test that work done in the threadpool ends up in the profile."""
+    response = client.get("/documents/", headers={"X-Profile": "true"})
+
+    assert response.status_code == 200
+    prof_file = next(profile_dir.glob("*.prof"))
+    stats = pstats.Stats(str(prof_file))
+    functions = {func_name for _, _, func_name in stats.stats}
+    assert "get_documents" in functions
+
+
+def test_profile_attributes_response_serialization(client: TestClient, profile_dir, sample_txt_file):
+    """Test that response model serialization after the endpoint returns is timed."""
+    filename, content, content_type = sample_txt_file
+
+    for i in range(20):
+        client.post(
+            "/documents/",
+            files={"file": (f"test{i}.txt", content, content_type)},
+        )
+
+    response = client.get("/documents/?page_size=100", headers={"X-Profile": "1"})
+
+    assert response.status_code == 200
+    report = json.loads(next(profile_dir.glob("*.json")).read_text())
+    assert set(report["phases_ms"]) == {"request_parsing", "database", "serialization", "response_body"}
+    for phase in ("request_parsing", "database", "serialization"):
+        assert report["phases_ms"][phase] > 0
+
+
+def test_profile_download(client: TestClient, profile_dir, sample_txt_file):
+    """Test that download file access and body sending are attributed to phases."""
+    filename, content, content_type = sample_txt_file
+
+    upload_response = client.post(
+        "/documents/",
+        files={"file": (filename, content, content_type)},
+    )
+    document_id = upload_response.json()["id"]
+
+    response = client.get(f"/documents/{document_id}/download", headers={"X-Profile": "1"})
+
+    assert response.status_code == 200
+    assert response.content == content
+    report = json.loads(next(profile_dir.glob("*.json")).read_text())
+    for phase in ("database", "file_io", "response_body"):
+        assert report["phases_ms"][phase] > 0
+
+
+class ExclusiveProfile(cProfile.Profile):
+    """Profiler that, like cProfile on Python 3.12+, allows one active instance."""
+
+    active = set()
+
+    def enable(self, *args, **kwargs):
+        if ExclusiveProfile.active:
+            raise ValueError("Another profiling tool is already active")
+        ExclusiveProfile.active.add(id(self))
+        super().enable(*args, **kwargs)
+
+    def disable(self):
+        super().disable()
+        ExclusiveProfile.active.discard(id(self))
+
+
+@pytest.mark.parametrize("per_thread", [True, False])
+def test_profile_survives_exclusive_profiler(client: TestClient, profile_dir, monkeypatch, per_thread):
+    """Test that a profiler that cannot be started never fails the request."""
+    import app.profiling as profiling
+    monkeypatch.setattr(profiling.cProfile, "Profile", ExclusiveProfile)
+    monkeypatch.setattr(profiling, "PER_THREAD_PROFILERS", per_thread)
+
+    response = client.get("/documents/", headers={"X-Profile": "1"})
+
+    assert response.status_code == 200
+    assert not ExclusiveProfile.active
+    report = json.loads(next(profile_dir.glob("*.json")).read_text())
+    assert "database" in report["phases_ms"]
+    assert len(list(profile_dir.glob("*.prof"))) == 1
+
+
+def test_profile_sample_rate(client: TestClient, tmp_path, monkeypatch):
+    """Test that sampling profiles requests without the header."""
+    import app.profiling as profiling
+    monkeypatch.setattr(profiling, "PROFILE_DIR", tmp_path)
+    monkeypatch.setattr(profiling, "PROFILE_SAMPLE_RATE", 1.0)
+
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert "x-profile-id" in response.headers
+    assert len(list(tmp_path.glob("*.prof"))) == 1
+
+
+def test_profile_export(client: TestClient, profile_dir, sample_txt_file):
+    """Test that streamed export batches are attributed to phases."""
+    filename, content, content_type = sample_txt_file
+
+    client.post(
+        "/documents/",
+        files={"file": (filename, content, content_type)},
+    )
+
+    response = client.get("/documents/export.ndjson", headers={"X-Profile": "1"})
+
+    assert response.status_code == 200
+    report = json.loads(next(profile_dir.glob("*.json")).read_text())
+    assert set(report["phases_ms"]) == {"request_parsing", "database", "serialization", "response_body"}